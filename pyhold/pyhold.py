@@ -2,10 +2,12 @@ from pyhold.pyholdkeyvalue import pyholdkeyvalue
 from pyhold.pyholdlinkedlist import pyholdlinkedlist
 
 class pyhold:
-    def __new__(cls, filename="pyhold.xml", mode="keyvalue", auto_sync=True, auto_reload=True):
+    def __new__(cls, filename="pyhold.xml", mode="keyvalue", auto_sync=True, auto_reload=True, format="xml"):
         if mode == "keyvalue":
-            return pyholdkeyvalue(filename, auto_sync, auto_reload)
+            return pyholdkeyvalue(filename, auto_sync, auto_reload, format)
         elif mode == "linkedlist":
+            if format != "xml":
+                raise NotImplementedError("Only the xml format is implemented in linkedlist mode.")
             return pyholdlinkedlist(filename, auto_sync, auto_reload)
         else:
             raise NotImplementedError("Only keyvalue mode is implemented.")
\ No newline at end of file
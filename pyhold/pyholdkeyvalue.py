@@ -1,150 +1,533 @@
 import os
 import json
+import atexit
+import threading
+import weakref
+from functools import lru_cache
+from xml.sax.saxutils import escape
 import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog
 import ast
-import xml.etree.ElementTree as ET
+try:
+    from lxml import etree as ET
+    _HAS_LXML = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    _HAS_LXML = False
+
+FORMATS = ("xml", "json", "jsonl")
+
+_LOADERS = {
+    "int": int,
+    "float": float,
+    "bool": lambda s: s == "True",
+    "dict": json.loads,
+    "list": json.loads,
+    "tuple": lambda s: tuple(json.loads(s)),
+    "NoneType": lambda _: None,
+    "str": lambda s: s,
+}
+
+# Only short numbers are memoized: strings parse to themselves, containers
+# are handed out to callers who may mutate them, and the cache bounds the
+# number of entries, not their size.
+_PARSE_CACHE_DTYPES = ("int", "float")
+_PARSE_CACHE_MAX_LEN = 64
+
+@lru_cache(maxsize=1024)
+def _parse_scalar(dtype, text):
+    return _LOADERS[dtype](text)
+
+def _parse(dtype, text):
+    if text is None or text == "None":
+        return None
+    if dtype in _PARSE_CACHE_DTYPES and len(text) <= _PARSE_CACHE_MAX_LEN:
+        return _parse_scalar(dtype, text)
+    return _LOADERS.get(dtype, str)(text)
+
+# A jsonl log is compacted once it holds more than this many records and
+# more than twice as many records as there are keys.
+_COMPACT_MIN_RECORDS = 1000
+
+_SERIALIZERS = {
+    str: lambda s: s,
+    int: str,
+    float: repr,
+    bool: lambda b: "True" if b else "False",
+    type(None): lambda _: "None",
+    dict: json.dumps,
+    list: json.dumps,
+    tuple: json.dumps,
+}
+
+# Values of these types cannot change after being stored.
+_IMMUTABLE_DTYPES = ("str", "int", "float", "bool", "NoneType")
+
+def _dump_value(value):
+    # Any other type is stored as its str() and loaded back as a string.
+    return _SERIALIZERS.get(type(value), str)(value)
+
+def _to_json_value(value, dtype):
+    # Types without a loader are stored as text, as in the XML format.
+    if dtype in _LOADERS:
+        return value
+    return str(value)
+
+def _put_line(key, dtype, value):
+    return json.dumps({"op": "put", "k": key, "t": dtype, "v": _to_json_value(value, dtype)}).encode('utf-8')
+
+def _from_json_value(value, dtype):
+    if dtype == "tuple":
+        return tuple(value)
+    return value
+
+# Only short texts (keys, enums, flags, counters) are worth memoizing; the
+# cache bounds the number of entries, not their size, so long texts such as
+# serialized containers are escaped directly.
+_ESC_CACHE_MAX_LEN = 64
+
+_esc_cached = lru_cache(maxsize=4096)(escape)
+
+def _esc(text):
+    if len(text) <= _ESC_CACHE_MAX_LEN:
+        return _esc_cached(text)
+    return escape(text)
+
+def _keyval_xml(key, dtype, text):
+    return f'<keyval><key>{_esc(key)}</key><value dtype="{dtype}">{_esc(text)}</value></keyval>'
+
+def _check_key(key):
+    # Every format stores keys as text, so other types would not load back
+    # as the same key.
+    if key is None:
+        raise ValueError("Key must be provided in keyvalue mode.")
+    if not isinstance(key, str):
+        raise TypeError(f"Key must be a string, not {type(key).__name__}.")
+
+# Stores with unsaved changes are flushed when the interpreter exits.
+_open_stores = weakref.WeakSet()
+
+def _flush_open_stores():
+    for store in list(_open_stores):
+        if store.auto_sync:
+            store.flush()
+
+atexit.register(_flush_open_stores)
 
 class pyholdkeyvalue:
-    def __init__(self, filename="pyhold.xml", auto_sync=True, auto_reload=True):
+    # Seconds to wait after a change before auto-syncing, so bursts of
+    # writes are saved once. Set to 0 to save on every change.
+    sync_delay = 0.05
+
+    def __init__(self, filename="pyhold.xml", auto_sync=True, auto_reload=True, format="xml"):
+        if format not in FORMATS:
+            raise ValueError(f"Unsupported format '{format}'. Expected one of: {', '.join(FORMATS)}.")
         self.filename = filename
         self.auto_sync = auto_sync
         self.auto_reload = auto_reload
-        self.volatileMem = []
+        self.format = format
+        self._index = {}
+        # The serialized <keyval> of every key is kept alongside the index
+        # and only the touched one is rebuilt on each change, so saving is a
+        # single join. The dict preserves insertion order, which is document
+        # order. Keys whose value is not an immutable scalar are tracked
+        # separately (for xml and jsonl) because those values can change in
+        # place and have to be written again on every save.
+        self._xml_by_key = {}
+        self._mutable_keys = {}
+        # Encoded jsonl records not yet appended to the file. None means the file
+        # does not match the log and has to be rewritten in full.
+        self._pending = None
+        self._log_records = 0
+        self._dirty = False
+        self._timer = None
+        self._sync_error = None
+        self._lock = threading.RLock()
+        _open_stores.add(self)
         if self.auto_reload:
             self.load_pyhold()
 
+    @property
+    def volatileMem(self):
+        return list(self)
+
     def write(self, key=None, value=None):
-        if key is None:
-            raise ValueError("Key must be provided in keyvalue mode.")
-        for item in self.volatileMem:
-            if item.key == key:
-                item.value = value
-                item.dtype = self.__keyvalNode(key, value).dtype
-                if self.auto_sync:
-                    self.save_pyhold()
-                return
-        tempNode = self.__keyvalNode(key, value)
-        self.volatileMem.append(tempNode)
-        if self.auto_sync:
-            self.save_pyhold()
+        _check_key(key)
+        with self._lock:
+            self._raise_sync_error()
+            self._set(key, value)
+            self._mark_dirty()
+
+    def bulk_write(self, mapping):
+        for key in mapping:
+            _check_key(key)
+        if not mapping:
+            return
+        with self._lock:
+            self._raise_sync_error()
+            # A value that fails to serialize stops the loop, but the keys
+            # written before it are still in the store and must be synced.
+            # The failing value is what gets reported; a failed save is kept
+            # for the next flush() or change.
+            try:
+                for key, value in mapping.items():
+                    self._set(key, value)
+            except Exception:
+                try:
+                    self._mark_dirty()
+                except Exception as e:
+                    self._sync_error = e
+                raise
+            self._mark_dirty()
+
+    def _set(self, key, value):
+        node = self._index.get(key)
+        if node is not None:
+            dtype = type(value).__name__
+            self._PUT_RECORD[self.format](self, key, dtype, value)
+            node.value = value
+            node.dtype = dtype
+            node.raw = False
+        else:
+            node = self.__keyvalNode(key, value)
+            self._PUT_RECORD[self.format](self, key, node.dtype, value)
+            self._index[key] = node
 
     def __getitem__(self, key):
-        for item in self.volatileMem:
-            if item.key == key:
-                return item.value
-        raise KeyError(f"Key '{key}' not found.")
+        try:
+            node = self._index[key]
+        except KeyError:
+            raise KeyError(f"Key '{key}' not found.") from None
+        return self._value(node)
+
+    def _value(self, node):
+        # Values loaded from XML keep their text until first read.
+        if node.raw:
+            with self._lock:
+                if node.raw:
+                    node.value = _parse(node.dtype, node.value)
+                    node.raw = False
+        return node.value
 
     def __len__(self):
-        return len(self.volatileMem)
+        return len(self._index)
 
     def __iter__(self):
-        return iter(self.volatileMem)
+        for node in self._index.values():
+            self._value(node)
+            yield node
 
     def __contains__(self, key):
-        return any(item.key == key for item in self.volatileMem)
+        return key in self._index
 
     def __setitem__(self, key, value):
-        for item in self.volatileMem:
-            if item.key == key:
-                item.value = value
-                if self.auto_sync:
-                    self.save_pyhold()
-                return
         self.write(key, value)
     
     def __delitem__(self, key):
-        for i, item in enumerate(self.volatileMem):
-            if item.key == key:
-                del self.volatileMem[i]
-                if self.auto_sync:
-                    self.save_pyhold()
-                return
-        raise KeyError(f"Key '{key}' not found.")
+        with self._lock:
+            self._raise_sync_error()
+            self._remove(key)
+            self._mark_dirty()
 
     def pop(self, key):
-        for i, item in enumerate(self.volatileMem):
-            if item.key == key:
-                value = item.value
-                del self.volatileMem[i]
-                if self.auto_sync:
-                    self.save_pyhold()
-                return value
-        raise KeyError(f"Key '{key}' not found.")
+        with self._lock:
+            self._raise_sync_error()
+            node = self._index.get(key)
+            if node is None:
+                raise KeyError(f"Key '{key}' not found.")
+            value = self._value(node)
+            self._remove(key)
+            self._mark_dirty()
+        return value
 
-    def save_pyhold(self):
-        root = ET.Element("pyhold")
-        for item in self.volatileMem:
-            key_val = ET.SubElement(root, "keyval")
+    def bulk_delete(self, keys):
+        keys = list(dict.fromkeys(keys))
+        if not keys:
+            return
+        with self._lock:
+            self._raise_sync_error()
+            for key in keys:
+                if key not in self._index:
+                    raise KeyError(f"Key '{key}' not found.")
+            for key in keys:
+                self._remove(key)
+            self._mark_dirty()
+
+    def _remove(self, key):
+        if self._index.pop(key, None) is None:
+            raise KeyError(f"Key '{key}' not found.")
+        self._DELETE_RECORD[self.format](self, key)
+
+    def _put_xml_record(self, key, dtype, value):
+        self._put_xml(key, dtype, _dump_value(value))
+
+    def _delete_xml_record(self, key):
+        del self._xml_by_key[key]
+        self._mutable_keys.pop(key, None)
+
+    def _put_json_record(self, key, dtype, value):
+        # The file is only written on save, but the value is encoded now so
+        # one JSON cannot represent is rejected before the store changes.
+        json.dumps(_to_json_value(value, dtype))
+
+    def _delete_json_record(self, key):
+        pass
+
+    def _put_jsonl_record(self, key, dtype, value):
+        # Encoded now, so a value JSON cannot represent is rejected before
+        # the store changes rather than on every later flush.
+        self._log(_put_line(key, dtype, value))
+        self._track_mutable(key, dtype)
+
+    def _delete_jsonl_record(self, key):
+        self._log(json.dumps({"op": "del", "k": key}).encode('utf-8'))
+        self._mutable_keys.pop(key, None)
+
+    # Per-change hooks for each format, looked up by format instead of
+    # branching on it for every write.
+    _PUT_RECORD = {
+        "xml": _put_xml_record,
+        "json": _put_json_record,
+        "jsonl": _put_jsonl_record,
+    }
+    _DELETE_RECORD = {
+        "xml": _delete_xml_record,
+        "json": _delete_json_record,
+        "jsonl": _delete_jsonl_record,
+    }
 
-            key_elem = ET.SubElement(key_val, "key")
-            key_elem.text = item.key
+    def _clear_records(self):
+        self._xml_by_key.clear()
+        self._mutable_keys.clear()
+        self._pending = None
 
-            value_elem = ET.SubElement(key_val, "value")
-            value_elem.set("dtype", item.dtype)
+    def _put_xml(self, key, dtype, text):
+        self._xml_by_key[key] = _keyval_xml(key, dtype, text)
+        self._track_mutable(key, dtype)
 
-            if item.dtype in ["dict", "list", "tuple"]:
-                value_elem.text = json.dumps(item.value)
-            elif item.value is None:
-                value_elem.text = "None"
+    def _track_mutable(self, key, dtype):
+        if dtype not in _IMMUTABLE_DTYPES:
+            self._mutable_keys[key] = None
+        else:
+            self._mutable_keys.pop(key, None)
+
+    def _log(self, record):
+        if self._pending is None:
+            return
+        self._pending.append(record)
+        # Stop queueing once a rewrite would be cheaper than the appends.
+        if len(self._pending) > max(_COMPACT_MIN_RECORDS, 2 * len(self._index)):
+            self._pending = None
+
+    def _mark_dirty(self):
+        self._dirty = True
+        if not self.auto_sync:
+            return
+        if self.sync_delay <= 0:
+            self.flush()
+        elif self._timer is None:
+            self._timer = threading.Timer(self.sync_delay, self._background_flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _background_flush(self):
+        # The timer thread has no caller to report to, so a failed save is
+        # kept and raised from the next flush(), or from the next change
+        # before it is applied.
+        try:
+            self.flush()
+        except Exception as e:
+            self._sync_error = e
+
+    def _raise_sync_error(self):
+        error = self._sync_error
+        if error is not None:
+            self._sync_error = None
+            raise error
+
+    def flush(self):
+        with self._lock:
+            self._cancel_timer()
+            self._raise_sync_error()
+            if not self._dirty:
+                return
+            if self.format == "jsonl" and self._pending is not None:
+                # Containers may have changed in place since they were logged.
+                for key in self._mutable_keys:
+                    item = self._index[key]
+                    self._log(_put_line(key, item.dtype, item.value))
+            if self.format == "jsonl" and self._pending is not None and \
+                    self._log_records + len(self._pending) <= max(_COMPACT_MIN_RECORDS, 2 * len(self._index)):
+                self._append_jsonl()
+                self._dirty = False
             else:
-                value_elem.text = str(item.value)
+                self.save_pyhold()
 
-        tree = ET.ElementTree(root)
-        tree.write(self.filename, encoding='utf-8', xml_declaration=True)
+    def _cancel_timer(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def save_pyhold(self):
+        with self._lock:
+            self._cancel_timer()
+            if self.format == "xml":
+                data = self._dump_xml()
+            elif self.format == "json":
+                data = self._dump_json()
+            else:
+                data = self._dump_jsonl()
+            # Write the whole file to a temporary sibling and swap it in, so
+            # a crash mid-save never leaves a truncated store behind.
+            tmp_filename = self.filename + '.tmp'
+            with open(tmp_filename, 'wb') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_filename, self.filename)
+            self._dirty = False
+
+    def _dump_xml(self):
+        # Containers (including tuples holding mutable items) and arbitrary
+        # objects can change after being stored, so they are re-serialized;
+        # immutable scalars are already up to date.
+        for key in self._mutable_keys:
+            item = self._index[key]
+            if item.raw:
+                continue
+            self._xml_by_key[key] = _keyval_xml(key, item.dtype, _dump_value(item.value))
+
+        return "".join((
+            "<?xml version='1.0' encoding='utf-8'?>\n<pyhold>",
+            "".join(self._xml_by_key.values()),
+            "</pyhold>",
+        )).encode('utf-8')
+
+    def _dump_json(self):
+        return json.dumps({item.key: [item.dtype, _to_json_value(item.value, item.dtype)]
+                           for item in self._index.values()}).encode('utf-8')
+
+    def _dump_jsonl(self):
+        # A rewritten log is a snapshot: one put record per key.
+        lines = [_put_line(item.key, item.dtype, item.value) for item in self._index.values()]
+        self._log_records = len(lines)
+        self._pending = []
+        lines.append(b"")
+        return b"\n".join(lines)
+
+    def _append_jsonl(self):
+        data = b"\n".join(self._pending + [b""])
+        with open(self.filename, 'ab') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        self._log_records += len(self._pending)
+        self._pending = []
 
     def load_pyhold(self):
-        if not os.path.exists(self.filename):
+        try:
+            f = open(self.filename, 'rb')
+        except FileNotFoundError:
             return
 
-        self.volatileMem.clear()
-        tree = ET.parse(self.filename)
-        root = tree.getroot()
+        with f, self._lock:
+            # Whatever was pending is discarded along with the in-memory data.
+            self._cancel_timer()
+            self._sync_error = None
+            self._index.clear()
+            self._clear_records()
+            if self.format == "xml":
+                self._load_xml(f)
+            elif self.format == "json":
+                self._load_json(f)
+            else:
+                self._load_jsonl(f)
+            self._dirty = False
 
-        for keyval in root.findall("keyval"):
+    def _load_xml(self, f):
+        # Stream the file and only handle closing tags, so each <keyval> is
+        # visited once and dropped as soon as it has been read.
+        if _HAS_LXML:
+            events = ET.iterparse(f, events=("end",), tag="keyval")
+        else:
+            events = ET.iterparse(f, events=("end",))
+
+        for _, keyval in events:
+            if keyval.tag != "keyval":
+                continue
             key = keyval.find("key").text
             value_elem = keyval.find("value")
             dtype = value_elem.attrib.get("dtype", "str")
             value_str = value_elem.text
 
-            if dtype == "int":
-                value = int(value_str)
-            elif dtype == "float":
-                value = float(value_str)
-            elif dtype == "bool":
-                value = value_str == "True"
-            elif dtype == "dict":
-                value = json.loads(value_str)
-            elif dtype == "list":
-                value = json.loads(value_str)
-            elif dtype == "tuple":
-                value = tuple(json.loads(value_str))
-            elif dtype == "NoneType" or value_str == "None":
-                value = None
+            if value_str is None or value_str == "None" or dtype not in _LOADERS:
+                node = self.__keyvalNode(key, _parse(dtype, value_str))
             else:
-                value = value_str
+                # Conversion is deferred to the first read, see _value().
+                node = self.__keyvalNode(key, value_str)
+                node.dtype = dtype
+                node.raw = True
+            self._index[key] = node
+            self._put_xml(key, node.dtype, "None" if node.value is None else value_str)
+
+            keyval.clear()
+            if _HAS_LXML:
+                while keyval.getprevious() is not None:
+                    del keyval.getparent()[0]
 
-            self.volatileMem.append(self.__keyvalNode(key, value))
+    def _load_json(self, f):
+        data = f.read()
+        if not data.strip():
+            return
+        for key, (dtype, value) in json.loads(data).items():
+            self._index[key] = self.__keyvalNode(key, _from_json_value(value, dtype))
+
+    def _load_jsonl(self, f):
+        lines = f.read().splitlines()
+        records = 0
+        for i, line in enumerate(lines):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                # A torn final record is left behind by an interrupted append.
+                if i == len(lines) - 1:
+                    break
+                raise
+            records += 1
+            key = record["k"]
+            if record["op"] == "put":
+                dtype = record["t"]
+                self._index[key] = self.__keyvalNode(key, _from_json_value(record["v"], dtype))
+                self._track_mutable(key, dtype)
+            else:
+                self._index.pop(key, None)
+                self._mutable_keys.pop(key, None)
+        self._log_records = records
+        self._pending = []
     
     def get(self, key, default=None):
-        for item in self.volatileMem:
-            if item.key == key:
-                return item.value
-        return default
+        node = self._index.get(key)
+        if node is None:
+            return default
+        return self._value(node)
     
     def keys(self):
-        return [item.key for item in self.volatileMem]
+        return list(self._index)
     
     def values(self):
-        return [item.value for item in self.volatileMem]
+        return [self._value(item) for item in self._index.values()]
     
     def items(self):
-        return [(item.key, item.value) for item in self.volatileMem]
+        return [(item.key, self._value(item)) for item in self._index.values()]
     
     def clear(self):
-        self.volatileMem.clear()
-        if self.auto_sync:
-            self.save_pyhold()
+        with self._lock:
+            self._raise_sync_error()
+            self._index.clear()
+            self._clear_records()
+            self._mark_dirty()
 
     def show_gui(self):
         # Main window setup
@@ -175,7 +558,7 @@ class pyholdkeyvalue:
                                font=('Arial', 16, 'bold'))
         title_label.pack(side=tk.LEFT)
         
-        info_label = ttk.Label(title_frame, text=f"File: {self.filename} | Items: {len(self.volatileMem)}")
+        info_label = ttk.Label(title_frame, text=f"File: {self.filename} | Items: {len(self._index)}")
         info_label.pack(side=tk.RIGHT)
         self.info_label = info_label
         
@@ -331,24 +714,21 @@ class pyholdkeyvalue:
     
     def clear_all(self):
         if messagebox.askyesno("Confirm", "Clear all data? This cannot be undone!"):
-            self.volatileMem.clear()
-            if self.auto_sync:
-                self.save_pyhold()
+            self.clear()
             self.refresh_view()
             self.status_label.config(text="All data cleared")
     
     def refresh_view(self):
-        # Clear existing items
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        # Clear existing items in a single Tk call
+        self.tree.delete(*self.tree.get_children())
         
         # Add current items
         search_term = self.search_entry.get().lower() if hasattr(self, 'search_entry') else ""
         
-        for item in self.volatileMem:
-            if not search_term or search_term in item.key.lower() or search_term in str(item.value).lower():
+        for item in self._index.values():
+            display_value = str(self._value(item))
+            if not search_term or search_term in item.key.lower() or search_term in display_value.lower():
                 # Truncate long values for display
-                display_value = str(item.value)
                 if len(display_value) > 100:
                     display_value = display_value[:97] + "..."
                 
@@ -356,7 +736,7 @@ class pyholdkeyvalue:
         
         # Update info label
         if hasattr(self, 'info_label'):
-            self.info_label.config(text=f"File: {self.filename} | Items: {len(self.volatileMem)}")
+            self.info_label.config(text=f"File: {self.filename} | Items: {len(self._index)}")
     
     def on_item_select(self, event):
         selected = self.tree.selection()
@@ -365,19 +745,18 @@ class pyholdkeyvalue:
             key = item['values'][0]
             
             # Find the actual item
-            for mem_item in self.volatileMem:
-                if mem_item.key == key:
-                    self.key_entry.delete(0, tk.END)
-                    self.key_entry.insert(0, key)
-                    
-                    self.value_text.delete(1.0, tk.END)
-                    if mem_item.dtype in ["dict", "list", "tuple"]:
-                        self.value_text.insert(1.0, json.dumps(mem_item.value, indent=2))
-                    else:
-                        self.value_text.insert(1.0, str(mem_item.value))
-                    
-                    self.type_var.set(mem_item.dtype)
-                    break
+            mem_item = self._index.get(key)
+            if mem_item is not None:
+                self.key_entry.delete(0, tk.END)
+                self.key_entry.insert(0, key)
+            
+                self.value_text.delete(1.0, tk.END)
+                if mem_item.dtype in ["dict", "list", "tuple"]:
+                    self.value_text.insert(1.0, json.dumps(self._value(mem_item), indent=2))
+                else:
+                    self.value_text.insert(1.0, str(self._value(mem_item)))
+            
+                self.type_var.set(mem_item.dtype)
     
     def on_item_double_click(self, event):
         selected = self.tree.selection()
@@ -386,24 +765,23 @@ class pyholdkeyvalue:
             key = item['values'][0]
             
             # Find and show full value in popup
-            for mem_item in self.volatileMem:
-                if mem_item.key == key:
-                    popup = tk.Toplevel(self.root)
-                    popup.title(f"Value for key: {key}")
-                    popup.geometry("600x400")
-                    
-                    text_widget = tk.Text(popup, wrap=tk.WORD)
-                    scrollbar = ttk.Scrollbar(popup, orient=tk.VERTICAL, command=text_widget.yview)
-                    text_widget.configure(yscrollcommand=scrollbar.set)
-                    
-                    if mem_item.dtype in ["dict", "list", "tuple"]:
-                        text_widget.insert(1.0, json.dumps(mem_item.value, indent=2))
-                    else:
-                        text_widget.insert(1.0, str(mem_item.value))
-                    
-                    text_widget.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-                    scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-                    break
+            mem_item = self._index.get(key)
+            if mem_item is not None:
+                popup = tk.Toplevel(self.root)
+                popup.title(f"Value for key: {key}")
+                popup.geometry("600x400")
+            
+                text_widget = tk.Text(popup, wrap=tk.WORD)
+                scrollbar = ttk.Scrollbar(popup, orient=tk.VERTICAL, command=text_widget.yview)
+                text_widget.configure(yscrollcommand=scrollbar.set)
+            
+                if mem_item.dtype in ["dict", "list", "tuple"]:
+                    text_widget.insert(1.0, json.dumps(self._value(mem_item), indent=2))
+                else:
+                    text_widget.insert(1.0, str(self._value(mem_item)))
+            
+                text_widget.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+                scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
     
     def filter_items(self, event):
         self.refresh_view()
@@ -429,8 +807,10 @@ class pyholdkeyvalue:
     
     def export_json(self):
         try:
-            data = {item.key: item.value for item in self.volatileMem}
+            data = dict(self.items())
             json_filename = self.filename.replace('.xml', '.json')
+            if json_filename == self.filename:
+                json_filename += '.export.json'
             
             with open(json_filename, 'w') as f:
                 json.dump(data, f, indent=2)
@@ -441,7 +821,10 @@ class pyholdkeyvalue:
             messagebox.showerror("Error", f"Failed to export: {str(e)}")
 
     class __keyvalNode:
+        __slots__ = ('key', 'value', 'dtype', 'raw')
+
         def __init__(self, key, value):
             self.key = key
             self.value = value
-            self.dtype = type(value).__name__
\ No newline at end of file
+            self.dtype = type(value).__name__
+            self.raw = False
\ No newline at end of file
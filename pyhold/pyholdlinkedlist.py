@@ -9,6 +9,8 @@ class LoadError(Exception):
     pass
 
 class llNode:
+    __slots__ = ('value', 'dtype', 'next')
+
     def __init__(self, value):
         self.value = value
         self.dtype = type(value).__name__
@@ -604,17 +606,16 @@ class pyholdlinkedlist:
             self.status_label.config(text="All data cleared")
     
     def refresh_view(self):
-        # Clear existing items
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        # Clear existing items in a single Tk call
+        self.tree.delete(*self.tree.get_children())
         
         # Add current items
         search_term = self.search_entry.get().lower() if hasattr(self, 'search_entry') else ""
         
         for i, value in enumerate(self):
-            if not search_term or search_term in str(value).lower():
+            display_value = str(value)
+            if not search_term or search_term in display_value.lower():
                 # Truncate long values for display
-                display_value = str(value)
                 if len(display_value) > 100:
                     display_value = display_value[:97] + "..."
                 
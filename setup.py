@@ -5,6 +5,7 @@ setup(
     version='0.2.1',
     packages=find_packages(include=['pyhold', 'pyhold.*']),
     install_requires=[],
+    extras_require={'fast': ['lxml']},
     author='Anjan Bellamkonda',
     description='A lightweight, persistent data store with dictionary, key-value, and linked list support with GUI',
     long_description=open('README.md').read(),
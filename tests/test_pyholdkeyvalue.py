@@ -0,0 +1,256 @@
+import math
+import os
+import tempfile
+import unittest
+
+from pyhold import pyhold
+from pyhold.pyholdkeyvalue import pyholdkeyvalue, FORMATS
+
+
+EDGE_VALUES = {
+    "int": 42,
+    "big_int": 2**80,
+    "float": 0.1,
+    "inf": float("-inf"),
+    "str": 'x<&>"y\n',
+    "bool": False,
+    "none": None,
+    "list": [1, "two", [3.0]],
+    "nested_big": [2**70],
+    "dict": {"k": "v", "n": [1, 2]},
+    "mixed": {"n": float("nan"), "big": [2**70]},
+    "tuple": (1, [2, 3]),
+}
+
+
+class KeyValueTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+
+    def path(self, name="store"):
+        return os.path.join(self.tmpdir.name, name)
+
+    def open_store(self, name="store", **kwargs):
+        store = pyholdkeyvalue(self.path(name), **kwargs)
+        # Leave nothing for the atexit hook once the temp dir is gone.
+        self.addCleanup(store.flush)
+        return store
+
+
+class RoundTripTest(KeyValueTestCase):
+    def assertSameValue(self, got, expected):
+        # repr() tells tuples from lists and makes NaN equal to itself.
+        self.assertEqual(repr(got), repr(expected))
+
+    def test_edge_values_round_trip_in_every_format(self):
+        for fmt in FORMATS:
+            with self.subTest(format=fmt):
+                store = self.open_store(fmt, format=fmt)
+                store.bulk_write(EDGE_VALUES)
+                store["nan"] = float("nan")
+                store.flush()
+
+                loaded = self.open_store(fmt, format=fmt)
+                self.assertEqual(loaded.keys(), list(EDGE_VALUES) + ["nan"])
+                for key, expected in EDGE_VALUES.items():
+                    self.assertSameValue(loaded[key], expected)
+                self.assertTrue(math.isnan(loaded["nan"]))
+
+    def test_updates_and_deletes_round_trip(self):
+        for fmt in FORMATS:
+            with self.subTest(format=fmt):
+                store = self.open_store(fmt, format=fmt)
+                store.bulk_write({"a": 1, "b": 2, "c": 3})
+                store["a"] = "one"
+                del store["b"]
+                self.assertEqual(store.pop("c"), 3)
+                store.flush()
+
+                self.assertEqual(self.open_store(fmt, format=fmt).items(), [("a", "one")])
+
+    def test_in_place_mutations_are_saved(self):
+        for fmt in FORMATS:
+            with self.subTest(format=fmt):
+                store = self.open_store(fmt, format=fmt)
+                store["list"] = [1]
+                store["tuple"] = ([1],)
+                store.flush()
+                store["list"].append(2)
+                store["tuple"][0].append(2)
+                store["other"] = 1
+                store.flush()
+
+                loaded = self.open_store(fmt, format=fmt)
+                self.assertEqual(loaded["list"], [1, 2])
+                self.assertEqual(loaded["tuple"], ([1, 2],))
+
+    def test_iterated_nodes_keep_their_key(self):
+        store = self.open_store(auto_sync=False)
+        store["a"] = 1
+        node = next(iter(store))
+        del store["a"]
+        store["b"] = 2
+        self.assertEqual((node.key, node.value), ("a", 1))
+
+
+    def test_non_string_keys_are_rejected(self):
+        for fmt in FORMATS:
+            with self.subTest(format=fmt):
+                store = self.open_store(fmt, format=fmt)
+                with self.assertRaises(TypeError):
+                    store[1] = "a"
+                with self.assertRaises(TypeError):
+                    store.bulk_write({"a": 1, 2: "b"})
+                self.assertEqual(len(store), 0)
+
+
+class JsonlLogTest(KeyValueTestCase):
+    def test_log_is_compacted(self):
+        store = self.open_store(format="jsonl")
+        store.sync_delay = 0
+        for i in range(3000):
+            store["counter"] = i
+
+        with open(self.path()) as f:
+            self.assertLessEqual(len(f.read().splitlines()), 1000)
+        self.assertEqual(self.open_store(format="jsonl")["counter"], 2999)
+
+    def test_torn_final_record_is_ignored(self):
+        store = self.open_store(format="jsonl")
+        store["a"] = 1
+        store.flush()
+        with open(self.path(), "ab") as f:
+            f.write(b'{"op": "put", "k": "b"')
+
+        self.assertEqual(self.open_store(format="jsonl").items(), [("a", 1)])
+
+    def test_store_without_reload_rewrites_the_log(self):
+        store = self.open_store(format="jsonl")
+        store["old"] = 1
+        store.flush()
+
+        fresh = self.open_store(format="jsonl", auto_reload=False)
+        fresh["new"] = 2
+        fresh.flush()
+
+        self.assertEqual(self.open_store(format="jsonl").keys(), ["new"])
+
+
+class AutoSyncTest(KeyValueTestCase):
+    def open_store(self, name="store", **kwargs):
+        store = super().open_store(name, **kwargs)
+        store.sync_delay = 0.01
+        return store
+
+    def wait_for_sync(self, store):
+        timer = store._timer
+        self.assertIsNotNone(timer)
+        timer.join()
+
+    def test_changes_are_coalesced_into_one_save(self):
+        store = self.open_store()
+        store.sync_delay = 60
+        store["0"] = 0
+        timer = store._timer
+        for i in range(1, 100):
+            store[str(i)] = i
+
+        self.assertIs(store._timer, timer)
+        self.assertFalse(os.path.exists(self.path()))
+        store.flush()
+        self.assertIsNone(store._timer)
+        self.assertEqual(len(self.open_store()), 100)
+
+    def test_auto_sync_resumes_after_reload(self):
+        store = self.open_store()
+        store["x"] = 1
+        store.flush()
+        store["y"] = 2
+        timer = store._timer
+        store.load_pyhold()
+        timer.join()
+        self.assertIsNone(store._timer)
+        store["z"] = 3
+        self.wait_for_sync(store)
+
+        self.assertEqual(self.open_store().keys(), ["x", "z"])
+
+    def test_background_save_error_is_raised_later(self):
+        store = self.open_store()
+        filename = store.filename
+        store.filename = os.path.join(self.tmpdir.name, "missing", "store")
+        store["x"] = 1
+        self.wait_for_sync(store)
+
+        with self.assertRaises(OSError):
+            store.flush()
+        store.filename = filename
+        store.flush()
+        self.assertEqual(self.open_store()["x"], 1)
+
+    def test_background_save_error_is_raised_before_the_next_change(self):
+        store = self.open_store()
+        filename = store.filename
+        store.filename = os.path.join(self.tmpdir.name, "missing", "store")
+        store["x"] = 1
+        self.wait_for_sync(store)
+
+        with self.assertRaises(OSError):
+            store["y"] = 2
+        self.assertNotIn("y", store)
+        store.filename = filename
+        store["z"] = 3
+        self.wait_for_sync(store)
+        self.assertEqual(self.open_store().keys(), ["x", "z"])
+
+    def test_bulk_write_error_is_not_masked_by_a_sync_error(self):
+        store = self.open_store()
+        store.sync_delay = 0
+        store.filename = os.path.join(self.tmpdir.name, "missing", "store")
+        with self.assertRaises(TypeError):
+            store.bulk_write({"k1": 1, "k2": (object(),)})
+
+        with self.assertRaises(OSError):
+            store.flush()
+        store.filename = self.path()
+        store.flush()
+        self.assertEqual(self.open_store().keys(), ["k1"])
+
+
+class BulkTest(KeyValueTestCase):
+    def test_bulk_write_syncs_keys_written_before_a_failing_value(self):
+        for fmt in FORMATS:
+            with self.subTest(format=fmt):
+                store = self.open_store(fmt, format=fmt)
+                with self.assertRaises(TypeError):
+                    store.bulk_write({"k1": 1, "k2": (object(),), "k3": 3})
+                store.flush()
+
+                self.assertEqual(store.keys(), ["k1"])
+                self.assertEqual(self.open_store(fmt, format=fmt).keys(), ["k1"])
+
+    def test_bulk_delete_with_missing_key_changes_nothing(self):
+        store = self.open_store(auto_sync=False)
+        store.bulk_write({"a": 1, "b": 2})
+        with self.assertRaises(KeyError):
+            store.bulk_delete(["a", "missing"])
+        self.assertEqual(store.keys(), ["a", "b"])
+
+        store.bulk_delete(["a", "a"])
+        self.assertEqual(store.keys(), ["b"])
+
+
+class FactoryTest(KeyValueTestCase):
+    def test_format_is_passed_through(self):
+        store = pyhold(self.path(), format="jsonl")
+        self.addCleanup(store.flush)
+        self.assertEqual(store.format, "jsonl")
+
+    def test_linkedlist_only_supports_xml(self):
+        with self.assertRaises(NotImplementedError):
+            pyhold(self.path(), mode="linkedlist", format="json")
+
+
+if __name__ == "__main__":
+    unittest.main()